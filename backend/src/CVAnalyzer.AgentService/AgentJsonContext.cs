@@ -0,0 +1,37 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using CVAnalyzer.AgentService.Models;
+
+namespace CVAnalyzer.AgentService;
+
+/// <summary>
+/// Source-generated serializer metadata for the agent wire and HTTP types.
+/// Serialization goes through compile-time generated code instead of reflection, so
+/// parsing and binding happen in a single pass with no runtime metadata lookups.
+/// This context backs the public HTTP responses, so it must not set write-side
+/// options (like null ignoring) that would change the wire format.
+/// </summary>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+[JsonSerializable(typeof(AgentResponse))]
+[JsonSerializable(typeof(AgentResponse[]))]
+[JsonSerializable(typeof(ResumeAnalysisRequest))]
+[JsonSerializable(typeof(ResumeAnalysisResponse))]
+internal sealed partial class AgentJsonContext : JsonSerializerContext
+{
+}
+
+/// <summary>
+/// Lenient fallback metadata used only after a strict parse fails. Tolerates trailing
+/// commas and comments that models occasionally emit, so an otherwise-valid (and paid
+/// for) completion is salvaged instead of being discarded.
+/// </summary>
+[JsonSourceGenerationOptions(
+    JsonSerializerDefaults.Web,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+    AllowTrailingCommas = true,
+    ReadCommentHandling = JsonCommentHandling.Skip)]
+[JsonSerializable(typeof(AgentResponse))]
+[JsonSerializable(typeof(AgentResponse[]))]
+internal sealed partial class LenientAgentJsonContext : JsonSerializerContext
+{
+}
@@ -13,4 +13,52 @@ public sealed class AgentServiceOptions
     public double TopP { get; set; } = 0.95;
 
     public string? ApiKey { get; set; }
+
+    /// <summary>
+    /// When enabled, near-duplicate resume submissions are served from the in-memory
+    /// semantic cache instead of calling the chat deployment. Requires
+    /// <see cref="EmbeddingDeployment"/> to be deployed alongside the chat model.
+    /// </summary>
+    public bool EnableSemanticCache { get; set; }
+
+    public string EmbeddingDeployment { get; set; } = "text-embedding-3-small";
+
+    /// <summary>
+    /// Minimum cosine similarity between content embeddings for a cached analysis
+    /// to be reused.
+    /// </summary>
+    public double SemanticCacheThreshold { get; set; } = 0.92;
+
+    /// <summary>
+    /// Relaxed similarity threshold used only when the chat deployment is
+    /// unavailable: a near-neighbour at or above this similarity is served as a
+    /// degraded result instead of failing the analysis.
+    /// </summary>
+    public double SemanticCacheFallbackThreshold { get; set; } = 0.85;
+
+    public int SemanticCacheCapacity { get; set; } = 256;
+
+    /// <summary>
+    /// Maximum number of analyses kept in the exact-match (SHA-256) LRU cache.
+    /// </summary>
+    public int ExactCacheCapacity { get; set; } = 1024;
+
+    /// <summary>
+    /// When enabled, concurrent /analyze requests arriving within
+    /// <see cref="BatchWindowMs"/> are coalesced into a single multi-resume
+    /// completion call of at most <see cref="BatchMaxSize"/> resumes.
+    /// </summary>
+    public bool EnableBatching { get; set; }
+
+    public int BatchWindowMs { get; set; } = 50;
+
+    public int BatchMaxSize { get; set; } = 4;
+
+    /// <summary>
+    /// Upper bound on the estimated number of tokens of resume content sent per
+    /// analysis; longer content is truncated at a word boundary. Zero disables the
+    /// budget. Tokens are what the model bills, so this bounds cost and guards
+    /// against oversized prompts being rejected after a full round-trip.
+    /// </summary>
+    public int MaxAnalysisTokens { get; set; } = 3000;
 }
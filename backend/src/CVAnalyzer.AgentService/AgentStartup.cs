@@ -1,4 +1,5 @@
 using Azure.AI.OpenAI;
+using Azure.Core.Pipeline;
 using Azure.Identity;
 using Microsoft.AspNetCore.Builder;
 using Microsoft.AspNetCore.Http;
@@ -9,12 +10,26 @@ namespace CVAnalyzer.AgentService;
 
 public class AgentStartup
 {
+    // One connection pool for all outbound model traffic. The pooled-connection
+    // lifetime keeps long-lived connections honoring DNS changes on the endpoint.
+    private static readonly HttpClient SharedHttpClient = new(new SocketsHttpHandler
+    {
+        PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+        MaxConnectionsPerServer = 100
+    });
+
     public void ConfigureServices(IServiceCollection services, WebApplicationBuilder builder)
     {
         services.AddEndpointsApiExplorer();
         services.AddSwaggerGen();
         services.AddProblemDetails();
 
+        // Serialize request/response bodies through source-generated metadata;
+        // unregistered types (health payloads, problem details) fall back to the
+        // default reflection resolver further down the chain.
+        services.ConfigureHttpJsonOptions(options =>
+            options.SerializerOptions.TypeInfoResolverChain.Insert(0, AgentJsonContext.Default));
+
         services.Configure<AgentServiceOptions>(builder.Configuration.GetSection(AgentServiceOptions.SectionName));
 
         services.AddSingleton<OpenAIClient>(sp =>
@@ -26,10 +41,18 @@ public class AgentStartup
             }
 
             var credential = new DefaultAzureCredential();
-            return new OpenAIClient(new Uri(options.Endpoint), credential);
+            var clientOptions = new OpenAIClientOptions
+            {
+                Transport = new HttpClientTransport(SharedHttpClient)
+            };
+            return new OpenAIClient(new Uri(options.Endpoint), credential, clientOptions);
         });
 
+        services.AddSingleton<Caching.ExactMatchResponseCache>();
+        services.AddSingleton<Caching.SemanticResponseCache>();
+        services.AddSingleton<Batching.AnalysisBatchCoordinator>();
         services.AddSingleton<ResumeAnalysisAgent>();
+        services.AddHostedService<AgentWarmupService>();
     }
 
     public void Configure(WebApplication app)
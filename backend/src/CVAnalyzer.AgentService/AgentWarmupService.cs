@@ -0,0 +1,75 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+using Azure.AI.OpenAI;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Options;
+
+namespace CVAnalyzer.AgentService;
+
+/// <summary>
+/// Issues a single one-token completion at startup so the first real analysis does
+/// not pay for TLS setup, credential token acquisition and connection-pool warmup.
+/// Failures are logged and swallowed — warmup must never block service start.
+/// </summary>
+public sealed class AgentWarmupService : BackgroundService
+{
+    private static readonly TimeSpan WarmupTimeout = TimeSpan.FromSeconds(10);
+
+    private readonly IServiceProvider _serviceProvider;
+    private readonly AgentServiceOptions _options;
+    private readonly ILogger<AgentWarmupService> _logger;
+
+    // The OpenAIClient is resolved lazily in ExecuteAsync: its factory throws when the
+    // agent is not configured (e.g. test environments), and warmup must not take the
+    // host down with it.
+    public AgentWarmupService(
+        IServiceProvider serviceProvider,
+        IOptions<AgentServiceOptions> options,
+        ILogger<AgentWarmupService> logger)
+    {
+        _serviceProvider = serviceProvider;
+        _options = options.Value;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (string.IsNullOrWhiteSpace(_options.Endpoint) || string.IsNullOrWhiteSpace(_options.Deployment))
+        {
+            _logger.LogInformation("Agent not configured; skipping warmup.");
+            return;
+        }
+
+        var chatOptions = new ChatCompletionsOptions
+        {
+            DeploymentName = _options.Deployment,
+            MaxTokens = 1
+        };
+        chatOptions.Messages.Add(new ChatRequestUserMessage("ping"));
+
+        try
+        {
+            using var timeout = CancellationTokenSource.CreateLinkedTokenSource(stoppingToken);
+            timeout.CancelAfter(WarmupTimeout);
+
+            var client = _serviceProvider.GetRequiredService<OpenAIClient>();
+            var startTimestamp = Stopwatch.GetTimestamp();
+            await client.GetChatCompletionsAsync(chatOptions, timeout.Token);
+
+            _logger.LogInformation(
+                "Agent warmup completed in {ElapsedMs}ms",
+                Math.Round(Stopwatch.GetElapsedTime(startTimestamp).TotalMilliseconds, 2));
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            // Host is shutting down
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Agent warmup failed; the first analysis will pay the cold-start cost.");
+        }
+    }
+}
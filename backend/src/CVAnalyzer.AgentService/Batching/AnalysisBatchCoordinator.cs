@@ -0,0 +1,141 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using CVAnalyzer.AgentService.Models;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CVAnalyzer.AgentService.Batching;
+
+/// <summary>
+/// Coalesces concurrent analysis requests into batched completion calls. Requests
+/// arriving within a short window (Agent:BatchWindowMs) are grouped up to
+/// Agent:BatchMaxSize and sent as one multi-resume prompt, amortizing per-call fixed
+/// latency across the batch. A lone arrival dispatches immediately — the window is
+/// only waited out when a second request is already queued — and batches are
+/// dispatched without blocking the drain loop, so collection of the next window
+/// overlaps batches already in flight.
+/// </summary>
+public sealed class AnalysisBatchCoordinator : IDisposable
+{
+    private readonly Channel<PendingAnalysis> _queue = Channel.CreateUnbounded<PendingAnalysis>();
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly AgentServiceOptions _options;
+    private readonly ILogger<AnalysisBatchCoordinator> _logger;
+    private readonly CancellationTokenSource _shutdown = new();
+    private readonly Task _drainLoop;
+
+    public AnalysisBatchCoordinator(
+        IServiceScopeFactory scopeFactory,
+        IOptions<AgentServiceOptions> options,
+        ILogger<AnalysisBatchCoordinator> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _options = options.Value;
+        _logger = logger;
+        _drainLoop = Task.Run(() => DrainAsync(_shutdown.Token));
+    }
+
+    public bool IsEnabled => _options.EnableBatching;
+
+    public async Task<ResumeAnalysisResponse> SubmitAsync(ResumeAnalysisRequest request, CancellationToken cancellationToken)
+    {
+        var pending = new PendingAnalysis(
+            request,
+            new TaskCompletionSource<ResumeAnalysisResponse>(TaskCreationOptions.RunContinuationsAsynchronously));
+
+        await _queue.Writer.WriteAsync(pending, cancellationToken);
+        return await pending.Completion.Task.WaitAsync(cancellationToken);
+    }
+
+    private async Task DrainAsync(CancellationToken cancellationToken)
+    {
+        var reader = _queue.Reader;
+        var inFlight = new List<Task>();
+
+        try
+        {
+            while (await reader.WaitToReadAsync(cancellationToken))
+            {
+                if (!reader.TryRead(out var first))
+                {
+                    continue;
+                }
+
+                var batch = new List<PendingAnalysis> { first };
+
+                // Only wait out the window when a follower is already queued; a lone
+                // arrival dispatches immediately and pays nothing for batching.
+                if (_options.BatchMaxSize > 1 && reader.TryRead(out var second))
+                {
+                    batch.Add(second);
+
+                    if (_options.BatchWindowMs > 0 && batch.Count < _options.BatchMaxSize)
+                    {
+                        await Task.Delay(TimeSpan.FromMilliseconds(_options.BatchWindowMs), cancellationToken);
+                    }
+
+                    while (batch.Count < _options.BatchMaxSize && reader.TryRead(out var next))
+                    {
+                        batch.Add(next);
+                    }
+                }
+
+                // Dispatch without awaiting so the loop keeps collecting the next
+                // window while this batch's completion call is in flight.
+                inFlight.RemoveAll(t => t.IsCompleted);
+                inFlight.Add(ProcessBatchAsync(batch, cancellationToken));
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Expected during shutdown
+        }
+
+        // ProcessBatchAsync never throws — failures resolve the pending completions —
+        // so this only waits for dispatched batches to settle before exiting.
+        await Task.WhenAll(inFlight);
+    }
+
+    private async Task ProcessBatchAsync(List<PendingAnalysis> batch, CancellationToken cancellationToken)
+    {
+        try
+        {
+            using var scope = _scopeFactory.CreateScope();
+            var agent = scope.ServiceProvider.GetRequiredService<ResumeAnalysisAgent>();
+
+            var responses = await agent.AnalyzeBatchAsync(
+                batch.Select(p => p.Request).ToArray(),
+                cancellationToken);
+
+            for (var i = 0; i < batch.Count; i++)
+            {
+                batch[i].Completion.TrySetResult(responses[i]);
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Batched analysis of {Count} resumes failed", batch.Count);
+
+            foreach (var pending in batch)
+            {
+                pending.Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    public void Dispose()
+    {
+        _shutdown.Cancel();
+        _queue.Writer.TryComplete();
+        _shutdown.Dispose();
+    }
+
+    private readonly record struct PendingAnalysis(
+        ResumeAnalysisRequest Request,
+        TaskCompletionSource<ResumeAnalysisResponse> Completion);
+}
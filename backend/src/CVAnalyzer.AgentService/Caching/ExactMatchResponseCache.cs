@@ -0,0 +1,73 @@
+using System;
+using System.Collections.Generic;
+using System.Security.Cryptography;
+using System.Text;
+using CVAnalyzer.AgentService.Models;
+using Microsoft.Extensions.Options;
+
+namespace CVAnalyzer.AgentService.Caching;
+
+/// <summary>
+/// Bounded LRU cache for resume analysis results keyed by SHA-256 of the resume content.
+/// Identical resubmissions (retry loops, double-clicked uploads) are served without any
+/// model call at all, making this the cheapest short-circuit ahead of the semantic cache.
+/// </summary>
+public sealed class ExactMatchResponseCache
+{
+    private readonly object _gate = new();
+    private readonly Dictionary<string, LinkedListNode<CacheEntry>> _entries = new();
+    private readonly LinkedList<CacheEntry> _order = new();
+    private readonly int _capacity;
+
+    public ExactMatchResponseCache(IOptions<AgentServiceOptions> options)
+    {
+        _capacity = Math.Max(1, options.Value.ExactCacheCapacity);
+    }
+
+    public bool TryGet(string content, out ResumeAnalysisResponse response)
+    {
+        var key = HashKey(content);
+
+        lock (_gate)
+        {
+            if (_entries.TryGetValue(key, out var node))
+            {
+                _order.Remove(node);
+                _order.AddLast(node);
+                response = node.Value.Response;
+                return true;
+            }
+        }
+
+        response = null!;
+        return false;
+    }
+
+    public void Set(string content, ResumeAnalysisResponse response)
+    {
+        var key = HashKey(content);
+
+        lock (_gate)
+        {
+            if (_entries.TryGetValue(key, out var existing))
+            {
+                _order.Remove(existing);
+                _entries.Remove(key);
+            }
+
+            _entries[key] = _order.AddLast(new CacheEntry(key, response));
+
+            if (_entries.Count > _capacity)
+            {
+                var oldest = _order.First!;
+                _order.RemoveFirst();
+                _entries.Remove(oldest.Value.Key);
+            }
+        }
+    }
+
+    private static string HashKey(string content) =>
+        Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(content)));
+
+    private readonly record struct CacheEntry(string Key, ResumeAnalysisResponse Response);
+}
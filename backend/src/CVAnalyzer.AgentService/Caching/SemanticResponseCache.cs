@@ -0,0 +1,159 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+using Azure.AI.OpenAI;
+using CVAnalyzer.AgentService.Models;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CVAnalyzer.AgentService.Caching;
+
+/// <summary>
+/// In-memory semantic cache for resume analysis results, keyed by an embedding of the
+/// resume content. Near-duplicate resubmissions (common while a candidate iterates on
+/// their resume) return the stored response instead of paying for another chat
+/// completion round-trip. Entries live in a fixed-size ring buffer; the oldest entry
+/// is overwritten once capacity is reached.
+/// </summary>
+public sealed class SemanticResponseCache
+{
+    private readonly OpenAIClient _client;
+    private readonly AgentServiceOptions _options;
+    private readonly ILogger<SemanticResponseCache> _logger;
+    private readonly object _gate = new();
+    private readonly float[][] _embeddings;
+    private readonly ResumeAnalysisResponse[] _responses;
+    private int _count;
+    private int _cursor;
+
+    public SemanticResponseCache(
+        OpenAIClient client,
+        IOptions<AgentServiceOptions> options,
+        ILogger<SemanticResponseCache> logger)
+    {
+        _client = client;
+        _options = options.Value;
+        _logger = logger;
+        var capacity = Math.Max(1, _options.SemanticCacheCapacity);
+        _embeddings = new float[capacity][];
+        _responses = new ResumeAnalysisResponse[capacity];
+    }
+
+    public bool IsEnabled =>
+        _options.EnableSemanticCache && !string.IsNullOrWhiteSpace(_options.EmbeddingDeployment);
+
+    /// <summary>
+    /// Embeds <paramref name="content"/> and searches the cache for a prior analysis whose
+    /// content embedding has cosine similarity at or above the configured threshold.
+    /// The computed embedding is returned either way so a subsequent <see cref="Store"/>
+    /// does not have to re-embed. Embedding failures disable the lookup for this call
+    /// rather than failing the analysis.
+    /// </summary>
+    public async Task<SemanticCacheLookup> LookupAsync(string content, CancellationToken cancellationToken)
+    {
+        if (!IsEnabled)
+        {
+            return SemanticCacheLookup.Miss;
+        }
+
+        float[] embedding;
+        try
+        {
+            embedding = await EmbedAsync(content, cancellationToken);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogWarning(ex, "Semantic cache embedding failed; skipping cache for this request.");
+            return SemanticCacheLookup.Miss;
+        }
+
+        var hit = FindNearest(embedding, _options.SemanticCacheThreshold);
+        return new SemanticCacheLookup(hit, embedding);
+    }
+
+    /// <summary>
+    /// Returns the cached response closest to <paramref name="embedding"/> if its cosine
+    /// similarity meets <paramref name="threshold"/>, otherwise null.
+    /// </summary>
+    public ResumeAnalysisResponse? FindNearest(float[] embedding, double threshold)
+    {
+        lock (_gate)
+        {
+            ResumeAnalysisResponse? best = null;
+            var bestSimilarity = threshold;
+
+            for (var i = 0; i < _count; i++)
+            {
+                var similarity = Dot(_embeddings[i], embedding);
+                if (similarity >= bestSimilarity)
+                {
+                    bestSimilarity = similarity;
+                    best = _responses[i];
+                }
+            }
+
+            return best;
+        }
+    }
+
+    public void Store(float[] embedding, ResumeAnalysisResponse response)
+    {
+        lock (_gate)
+        {
+            _embeddings[_cursor] = embedding;
+            _responses[_cursor] = response;
+            _cursor = (_cursor + 1) % _embeddings.Length;
+            if (_count < _embeddings.Length)
+            {
+                _count++;
+            }
+        }
+    }
+
+    private async Task<float[]> EmbedAsync(string content, CancellationToken cancellationToken)
+    {
+        var response = await _client.GetEmbeddingsAsync(
+            new EmbeddingsOptions(_options.EmbeddingDeployment, new[] { content }),
+            cancellationToken);
+
+        var embedding = response.Value.Data[0].Embedding.ToArray();
+        Normalize(embedding);
+        return embedding;
+    }
+
+    private static void Normalize(float[] vector)
+    {
+        var magnitude = Math.Sqrt(Dot(vector, vector));
+        if (magnitude == 0)
+        {
+            return;
+        }
+
+        for (var i = 0; i < vector.Length; i++)
+        {
+            vector[i] = (float)(vector[i] / magnitude);
+        }
+    }
+
+    private static float Dot(float[] left, float[] right)
+    {
+        var sum = 0f;
+        var length = Math.Min(left.Length, right.Length);
+        for (var i = 0; i < length; i++)
+        {
+            sum += left[i] * right[i];
+        }
+
+        return sum;
+    }
+}
+
+/// <summary>
+/// Result of a semantic cache lookup: the cached response when a near neighbour was
+/// found, plus the embedding of the looked-up content so it can be stored without
+/// re-embedding after a fresh analysis.
+/// </summary>
+public readonly record struct SemanticCacheLookup(ResumeAnalysisResponse? Response, float[]? Embedding)
+{
+    public static SemanticCacheLookup Miss => new(null, null);
+}
@@ -0,0 +1,29 @@
+using System.Collections.Generic;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace CVAnalyzer.AgentService.Models;
+
+/// <summary>
+/// Wire format of the model's analysis payload, deserialized from the
+/// resume_analysis function-call arguments (or raw message content). Candidate info
+/// and suggestions bind directly to the public DTOs so mapping to
+/// <see cref="ResumeAnalysisResponse"/> does not need a second construction pass.
+/// </summary>
+internal sealed class AgentResponse
+{
+    [JsonPropertyName("score")]
+    public double Score { get; init; }
+
+    [JsonPropertyName("optimizedContent")]
+    public string OptimizedContent { get; init; } = string.Empty;
+
+    [JsonPropertyName("candidateInfo")]
+    public CandidateInfoDto? CandidateInfo { get; init; }
+
+    [JsonPropertyName("suggestions")]
+    public ResumeSuggestion[]? Suggestions { get; init; }
+
+    [JsonPropertyName("metadata")]
+    public Dictionary<string, JsonElement>? Metadata { get; init; }
+}
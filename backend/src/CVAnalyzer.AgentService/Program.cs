@@ -2,10 +2,12 @@ using System;
 using System.Collections.Generic;
 using System.ComponentModel.DataAnnotations;
 using System.Linq;
+using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
 using Azure.AI.OpenAI;
 using Azure.Identity;
+using CVAnalyzer.AgentService.Batching;
 using CVAnalyzer.AgentService.Models;
 using Microsoft.AspNetCore.Builder;
 using Microsoft.AspNetCore.Hosting;
@@ -49,6 +51,7 @@ public static class Program
         app.MapPost("/analyze", async (
                 ResumeAnalysisRequest request,
                 ResumeAnalysisAgent agent,
+                AnalysisBatchCoordinator batchCoordinator,
                 CancellationToken cancellationToken) =>
             {
                 if (!MiniValidator.TryValidate(request, out var errors))
@@ -56,13 +59,40 @@ public static class Program
                     return Results.ValidationProblem(errors);
                 }
 
-                var result = await agent.AnalyzeAsync(request, cancellationToken);
+                var result = batchCoordinator.IsEnabled
+                    ? await batchCoordinator.SubmitAsync(request, cancellationToken)
+                    : await agent.AnalyzeAsync(request, cancellationToken);
                 return Results.Ok(result);
             })
             .WithName("AnalyzeResume")
             .Produces<ResumeAnalysisResponse>()
             .ProducesValidationProblem();
 
+        app.MapPost("/analyze/stream", (
+                ResumeAnalysisRequest request,
+                ResumeAnalysisAgent agent,
+                CancellationToken cancellationToken) =>
+            {
+                if (!MiniValidator.TryValidate(request, out var errors))
+                {
+                    return Results.ValidationProblem(errors);
+                }
+
+                // Streams the raw model payload as it is generated. Unlike /analyze,
+                // the output is not validated, normalized or wrapped in metadata, and
+                // a text-mode answer may fence the JSON in markdown — hence text/plain.
+                return Results.Stream(async stream =>
+                {
+                    await foreach (var chunk in agent.AnalyzeStreamAsync(request, cancellationToken))
+                    {
+                        await stream.WriteAsync(Encoding.UTF8.GetBytes(chunk), cancellationToken);
+                        await stream.FlushAsync(cancellationToken);
+                    }
+                }, "text/plain; charset=utf-8");
+            })
+            .WithName("AnalyzeResumeStream")
+            .ProducesValidationProblem();
+
         await app.RunAsync();
     }
 
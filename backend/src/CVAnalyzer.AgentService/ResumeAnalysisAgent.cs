@@ -1,10 +1,15 @@
 using System;
+using System.Collections.Frozen;
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using System.Text;
 using System.Text.Json;
-using System.Text.Json.Serialization;
+using System.Text.RegularExpressions;
 using System.Collections.Generic;
 using System.Linq;
 using Azure;
 using Azure.AI.OpenAI;
+using CVAnalyzer.AgentService.Caching;
 using CVAnalyzer.AgentService.Models;
 using CVAnalyzer.Domain.Entities;
 using CVAnalyzer.Domain.Repositories;
@@ -13,35 +18,45 @@ using Microsoft.Extensions.Options;
 
 namespace CVAnalyzer.AgentService;
 
-public sealed class ResumeAnalysisAgent
+public sealed partial class ResumeAnalysisAgent
 {
-    private static readonly JsonSerializerOptions JsonOptions = new(JsonSerializerDefaults.Web)
-    {
-        PropertyNameCaseInsensitive = true,
-        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
-    };
-
     private readonly OpenAIClient _client;
     private readonly AgentServiceOptions _options;
     private readonly IPromptTemplateRepository _promptRepository;
+    private readonly ExactMatchResponseCache _exactCache;
+    private readonly SemanticResponseCache _semanticCache;
     private readonly ILogger<ResumeAnalysisAgent> _logger;
     private readonly string _environment;
 
+    // Options are immutable for the process lifetime, so values derived from them are
+    // computed once here instead of on every request.
+    private readonly float _temperature;
+    private readonly float _topP;
+    private readonly bool _isConfigured;
+
     public ResumeAnalysisAgent(
-        OpenAIClient client, 
-        IOptions<AgentServiceOptions> options, 
+        OpenAIClient client,
+        IOptions<AgentServiceOptions> options,
         IPromptTemplateRepository promptRepository,
+        ExactMatchResponseCache exactCache,
+        SemanticResponseCache semanticCache,
         IHostEnvironment hostEnvironment,
         ILogger<ResumeAnalysisAgent> logger)
     {
         _client = client;
         _options = options.Value;
         _promptRepository = promptRepository;
+        _exactCache = exactCache;
+        _semanticCache = semanticCache;
         _environment = hostEnvironment.EnvironmentName ?? "Production";
         _logger = logger;
+
+        _temperature = (float)_options.Temperature;
+        _topP = (float)_options.TopP;
+        _isConfigured = !string.IsNullOrWhiteSpace(_options.Endpoint) && !string.IsNullOrWhiteSpace(_options.Deployment);
     }
 
-    public bool IsConfigured => !string.IsNullOrWhiteSpace(_options.Endpoint) && !string.IsNullOrWhiteSpace(_options.Deployment);
+    public bool IsConfigured => _isConfigured;
 
     public async Task<ResumeAnalysisResponse> AnalyzeAsync(ResumeAnalysisRequest request, CancellationToken cancellationToken)
     {
@@ -50,13 +65,59 @@ public sealed class ResumeAnalysisAgent
             throw new InvalidOperationException("Agent service is not configured. Ensure Agent:Endpoint and Agent:Deployment are set.");
         }
 
+        var startTimestamp = Stopwatch.GetTimestamp();
+
         _logger.LogInformation("Starting resume analysis for user {UserId}", request.UserId);
         _logger.LogInformation("Using endpoint: {Endpoint}, deployment: {Deployment}", _options.Endpoint, _options.Deployment);
 
-        var chatOptions = await BuildChatOptionsAsync(request.Content, cancellationToken);
+        if (_exactCache.TryGet(request.Content, out var exactHit))
+        {
+            _logger.LogInformation("Exact-match cache hit for user {UserId}; skipping analysis.", request.UserId);
+            return WithCacheHitMetadata(exactHit, Stopwatch.GetElapsedTime(startTimestamp));
+        }
+
+        var cacheLookup = await _semanticCache.LookupAsync(request.Content, cancellationToken);
+        if (cacheLookup.Response is not null)
+        {
+            _logger.LogInformation("Semantic cache hit for user {UserId}; skipping chat completion.", request.UserId);
+            return WithCacheHitMetadata(cacheLookup.Response, Stopwatch.GetElapsedTime(startTimestamp), semantic: true);
+        }
+
+        var content = TruncateToTokenBudget(request.Content, _options.MaxAnalysisTokens);
+        if (!ReferenceEquals(content, request.Content))
+        {
+            _logger.LogWarning(
+                "Resume content for user {UserId} exceeded the {MaxTokens}-token budget and was truncated.",
+                request.UserId, _options.MaxAnalysisTokens);
+        }
+
+        var chatOptions = CreateChatOptions(await GetSystemPromptAsync(cancellationToken), content);
 
         _logger.LogInformation("Calling Azure OpenAI with {MessageCount} messages", chatOptions.Messages.Count);
-        var completion = await _client.GetChatCompletionsAsync(chatOptions, cancellationToken);
+
+        // Provider failures and timeouts (but never the caller's own cancellation) fall
+        // back to the nearest semantic-cache neighbour at a relaxed threshold, so a warm
+        // cache keeps serving slightly stale results through a partial outage.
+        Response<ChatCompletions> completion;
+        try
+        {
+            completion = await _client.GetChatCompletionsAsync(chatOptions, cancellationToken);
+        }
+        catch (Exception ex) when (
+            (ex is RequestFailedException || ex is OperationCanceledException)
+            && !cancellationToken.IsCancellationRequested)
+        {
+            var fallback = TryGetDegradedFallback(cacheLookup.Embedding);
+            if (fallback is null)
+            {
+                throw;
+            }
+
+            _logger.LogWarning(ex,
+                "Chat completion failed for user {UserId}; serving a degraded result from the semantic cache.",
+                request.UserId);
+            return fallback;
+        }
         _logger.LogInformation("Received completion with {ChoiceCount} choices", completion.Value.Choices?.Count ?? 0);
         
         var message = completion.Value.Choices?.FirstOrDefault()?.Message;
@@ -68,17 +129,17 @@ public sealed class ResumeAnalysisAgent
         }
 
         // Handle function call response (when using Functions API)
-        string jsonPayload;
+        ReadOnlyMemory<char> jsonPayload;
         if (message.FunctionCall != null)
         {
             _logger.LogInformation("Response is a function call: {FunctionName}", message.FunctionCall.Name);
-            jsonPayload = message.FunctionCall.Arguments;
-            _logger.LogInformation("Function arguments length: {Length} chars", jsonPayload?.Length ?? 0);
+            jsonPayload = message.FunctionCall.Arguments.AsMemory();
+            _logger.LogInformation("Function arguments length: {Length} chars", jsonPayload.Length);
         }
         else if (!string.IsNullOrWhiteSpace(message.Content))
         {
             _logger.LogInformation("Response is text content, length: {Length} chars", message.Content.Length);
-            jsonPayload = message.Content;
+            jsonPayload = ExtractJsonPayload(message.Content);
         }
         else
         {
@@ -89,47 +150,211 @@ public sealed class ResumeAnalysisAgent
             
             throw new InvalidOperationException("AI response was empty.");
         }
-        if (string.IsNullOrWhiteSpace(jsonPayload))
+        if (jsonPayload.IsEmpty || jsonPayload.Span.IsWhiteSpace())
         {
             _logger.LogError("Agent response did not include text content.");
             throw new InvalidOperationException("AI response did not include text content.");
         }
 
-        var agentResponse = JsonSerializer.Deserialize<AgentResponse>(jsonPayload, JsonOptions);
+        var agentResponse = DeserializeAgentResponse(jsonPayload);
         if (agentResponse is null)
         {
-            _logger.LogError("Failed to deserialize agent response: {Payload}", jsonPayload);
+            _logger.LogError("Failed to deserialize agent response: {Payload}", jsonPayload.ToString());
             throw new InvalidOperationException("Unable to parse AI response.");
         }
 
-        _logger.LogInformation("Resume analysis completed for user {UserId} with score {Score}", request.UserId, agentResponse.Score);
+        var elapsed = Stopwatch.GetElapsedTime(startTimestamp);
+        _logger.LogInformation(
+            "Resume analysis completed for user {UserId} with score {Score} in {ElapsedMs}ms",
+            request.UserId, agentResponse.Score, Math.Round(elapsed.TotalMilliseconds, 2));
+
+        var response = MapResponse(agentResponse, elapsed);
+
+        _exactCache.Set(request.Content, response);
+
+        if (cacheLookup.Embedding is not null)
+        {
+            _semanticCache.Store(cacheLookup.Embedding, response);
+        }
+
+        return response;
+    }
+
+    private ResumeAnalysisResponse? TryGetDegradedFallback(float[]? embedding)
+    {
+        if (embedding is null)
+        {
+            return null;
+        }
+
+        var cached = _semanticCache.FindNearest(embedding, _options.SemanticCacheFallbackThreshold);
+        if (cached is null)
+        {
+            return null;
+        }
+
+        var metadata = new Dictionary<string, JsonElement>(cached.Metadata)
+        {
+            ["degraded"] = JsonSerializer.SerializeToElement(true)
+        };
 
         return new ResumeAnalysisResponse
         {
-            Score = Math.Clamp(agentResponse.Score, 0, 100),
-            OptimizedContent = agentResponse.OptimizedContent,
-            CandidateInfo = agentResponse.CandidateInfo != null ? new CandidateInfoDto
-            {
-                FullName = agentResponse.CandidateInfo.FullName,
-                Email = agentResponse.CandidateInfo.Email,
-                Phone = agentResponse.CandidateInfo.Phone,
-                Location = agentResponse.CandidateInfo.Location,
-                Skills = agentResponse.CandidateInfo.Skills,
-                YearsOfExperience = agentResponse.CandidateInfo.YearsOfExperience,
-                CurrentJobTitle = agentResponse.CandidateInfo.CurrentJobTitle,
-                Education = agentResponse.CandidateInfo.Education
-            } : null,
-            Suggestions = agentResponse.Suggestions?.Select(s => new ResumeSuggestion
+            Score = cached.Score,
+            OptimizedContent = cached.OptimizedContent,
+            CandidateInfo = cached.CandidateInfo,
+            Suggestions = cached.Suggestions,
+            Metadata = metadata
+        };
+    }
+
+    private static ResumeAnalysisResponse WithCacheHitMetadata(ResumeAnalysisResponse cached, TimeSpan elapsed, bool semantic = false)
+    {
+        // Timing fields describe this lookup, not the original analysis, so latency
+        // telemetry sees the (near-zero) hit time rather than the cached value.
+        var metadata = new Dictionary<string, JsonElement>(cached.Metadata)
+        {
+            ["processingTimeMs"] = JsonSerializer.SerializeToElement(Math.Round(elapsed.TotalMilliseconds, 2)),
+            ["timestamp"] = JsonSerializer.SerializeToElement(DateTime.UtcNow),
+            ["cacheHit"] = JsonSerializer.SerializeToElement(true)
+        };
+
+        if (semantic)
+        {
+            metadata["semanticCacheHit"] = JsonSerializer.SerializeToElement(true);
+        }
+
+        return new ResumeAnalysisResponse
+        {
+            Score = cached.Score,
+            OptimizedContent = cached.OptimizedContent,
+            CandidateInfo = cached.CandidateInfo,
+            Suggestions = cached.Suggestions,
+            Metadata = metadata
+        };
+    }
+
+    /// <summary>
+    /// Streams the raw model payload as it is generated, so callers can start
+    /// consuming output at time-to-first-token instead of waiting for the full
+    /// completion. Chunks concatenate to the unprocessed payload: function-call
+    /// arguments are plain JSON, but a text-mode answer may wrap the JSON in a
+    /// markdown fence with surrounding prose, and none of the blocking path's
+    /// extraction, validation or metadata stamping is applied. Assembling and
+    /// parsing the result is the caller's responsibility, and streamed results
+    /// are not cached.
+    /// </summary>
+    public async IAsyncEnumerable<string> AnalyzeStreamAsync(
+        ResumeAnalysisRequest request,
+        [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        if (!IsConfigured)
+        {
+            throw new InvalidOperationException("Agent service is not configured. Ensure Agent:Endpoint and Agent:Deployment are set.");
+        }
+
+        _logger.LogInformation("Starting streamed resume analysis for user {UserId}", request.UserId);
+
+        var chatOptions = CreateChatOptions(
+            await GetSystemPromptAsync(cancellationToken),
+            TruncateToTokenBudget(request.Content, _options.MaxAnalysisTokens));
+        var streamingResponse = await _client.GetChatCompletionsStreamingAsync(chatOptions, cancellationToken);
+
+        await foreach (var update in streamingResponse.WithCancellation(cancellationToken))
+        {
+            // Function-call completions stream their arguments; plain-text completions
+            // stream content. Either way the deltas concatenate to the JSON payload.
+            var chunk = update.FunctionArgumentsUpdate ?? update.ContentUpdate;
+            if (!string.IsNullOrEmpty(chunk))
             {
-                Category = s.Category,
-                Description = s.Description,
-                Priority = Math.Clamp(s.Priority, 1, 5)
-            }).ToArray() ?? Array.Empty<ResumeSuggestion>(),
-            Metadata = agentResponse.Metadata ?? new Dictionary<string, JsonElement>()
+                yield return chunk;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Analyzes several resumes with a single completion call. The combined prompt asks
+    /// for a JSON array with one analysis per resume in submission order, amortizing the
+    /// per-call fixed costs (network, auth, prompt prefix) across the batch. Single-item
+    /// batches fall through to the regular path, including its cache lookups.
+    /// </summary>
+    public async Task<IReadOnlyList<ResumeAnalysisResponse>> AnalyzeBatchAsync(
+        IReadOnlyList<ResumeAnalysisRequest> requests,
+        CancellationToken cancellationToken)
+    {
+        if (requests.Count == 0)
+        {
+            return Array.Empty<ResumeAnalysisResponse>();
+        }
+
+        if (requests.Count == 1)
+        {
+            return new[] { await AnalyzeAsync(requests[0], cancellationToken) };
+        }
+
+        if (!IsConfigured)
+        {
+            throw new InvalidOperationException("Agent service is not configured. Ensure Agent:Endpoint and Agent:Deployment are set.");
+        }
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+
+        _logger.LogInformation("Starting batched resume analysis for {Count} resumes", requests.Count);
+
+        // Function calling is bound to a single analysis object, so the batch path asks
+        // for a plain-text JSON array instead.
+        var options = new ChatCompletionsOptions
+        {
+            DeploymentName = _options.Deployment,
+            Temperature = _temperature,
+            NucleusSamplingFactor = _topP,
+            MaxTokens = 1200 * requests.Count
         };
+
+        var bounded = requests
+            .Select(r =>
+            {
+                var content = TruncateToTokenBudget(r.Content, _options.MaxAnalysisTokens);
+                return ReferenceEquals(content, r.Content)
+                    ? r
+                    : new ResumeAnalysisRequest { Content = content, UserId = r.UserId };
+            })
+            .ToArray();
+
+        options.Messages.Add(new ChatRequestSystemMessage(await GetSystemPromptAsync(cancellationToken)));
+        options.Messages.Add(new ChatRequestUserMessage(BuildBatchPrompt(bounded)));
+
+        var completion = await _client.GetChatCompletionsAsync(options, cancellationToken);
+        var message = completion.Value.Choices?.FirstOrDefault()?.Message;
+
+        if (message is null || string.IsNullOrWhiteSpace(message.Content))
+        {
+            _logger.LogError("Batch response did not include text content.");
+            throw new InvalidOperationException("AI batch response did not include text content.");
+        }
+
+        var agentResponses = DeserializeAgentResponses(ExtractJsonPayload(message.Content));
+        if (agentResponses is null || agentResponses.Length != requests.Count)
+        {
+            _logger.LogError(
+                "Batch response contained {ResponseCount} analyses for {RequestCount} resumes.",
+                agentResponses?.Length ?? 0, requests.Count);
+            throw new InvalidOperationException("AI batch response did not match the submitted resumes.");
+        }
+
+        var elapsed = Stopwatch.GetElapsedTime(startTimestamp);
+        var responses = new ResumeAnalysisResponse[requests.Count];
+        for (var i = 0; i < requests.Count; i++)
+        {
+            responses[i] = MapResponse(agentResponses[i], elapsed);
+            _exactCache.Set(requests[i].Content, responses[i]);
+        }
+
+        _logger.LogInformation("Batched resume analysis completed for {Count} resumes", requests.Count);
+        return responses;
     }
 
-    private async Task<ChatCompletionsOptions> BuildChatOptionsAsync(string resumeContent, CancellationToken cancellationToken)
+    private async Task<string> GetSystemPromptAsync(CancellationToken cancellationToken)
     {
         // Fetch environment-specific prompt from database with fallback on failure
         PromptTemplate? promptTemplate = null;
@@ -150,62 +375,205 @@ public sealed class ResumeAnalysisAgent
 
         if (promptTemplate == null)
         {
+            // Fallback to hardcoded prompt if database is unavailable
             _logger.LogWarning(
                 "No active prompt found for {Environment}/ResumeAnalyzer/Evaluation. Using fallback prompt.",
                 _environment);
-            
-            // Fallback to hardcoded prompt if database is unavailable
-            return BuildFallbackChatOptions(resumeContent);
+
+            return FallbackSystemPrompt;
         }
 
         _logger.LogInformation(
             "Using prompt version {Version} for {Environment}/ResumeAnalyzer/Evaluation",
             promptTemplate.Version, _environment);
 
-        var options = new ChatCompletionsOptions
+        return promptTemplate.Content;
+    }
+
+    private static ResumeAnalysisResponse MapResponse(AgentResponse agentResponse, TimeSpan elapsed)
+    {
+        // Monotonic elapsed time from Stopwatch; the wall-clock timestamp is informational.
+        var metadata = agentResponse.Metadata ?? new Dictionary<string, JsonElement>();
+        metadata["processingTimeMs"] = JsonSerializer.SerializeToElement(Math.Round(elapsed.TotalMilliseconds, 2));
+        metadata["timestamp"] = JsonSerializer.SerializeToElement(DateTime.UtcNow);
+
+        // The wire types bind straight to the public DTOs; only suggestions with an
+        // out-of-range priority or an unrecognized category need to be rebuilt.
+        var suggestions = agentResponse.Suggestions ?? Array.Empty<ResumeSuggestion>();
+        for (var i = 0; i < suggestions.Length; i++)
         {
-            DeploymentName = _options.Deployment,
-            Temperature = (float)_options.Temperature,
-            NucleusSamplingFactor = (float)_options.TopP,
-            MaxTokens = 1200,
-            Functions = { new FunctionDefinition 
-            { 
-                Name = "resume_analysis",
-                Description = "Analyze a resume and provide structured feedback",
-                Parameters = BinaryData.FromString(JsonSchema)
-            }}
+            var category = NormalizeCategory(suggestions[i].Category);
+            if (suggestions[i].Priority is < 1 or > 5 || !string.Equals(category, suggestions[i].Category, StringComparison.Ordinal))
+            {
+                suggestions[i] = new ResumeSuggestion
+                {
+                    Category = category,
+                    Description = suggestions[i].Description,
+                    Priority = Math.Clamp(suggestions[i].Priority, 1, 5)
+                };
+            }
+        }
+
+        return new ResumeAnalysisResponse
+        {
+            Score = Math.Clamp(agentResponse.Score, 0, 100),
+            OptimizedContent = agentResponse.OptimizedContent,
+            CandidateInfo = agentResponse.CandidateInfo,
+            Suggestions = suggestions,
+            Metadata = metadata
         };
+    }
 
-        options.Messages.Add(new ChatRequestSystemMessage(promptTemplate.Content));
-        options.Messages.Add(new ChatRequestUserMessage(resumeContent));
+    /// <summary>
+    /// Parses the extracted payload strictly first, then retries with lenient options
+    /// (trailing commas, comments) so a malformed-but-recoverable completion still
+    /// yields an analysis instead of wasting the whole model call.
+    /// </summary>
+    internal AgentResponse? DeserializeAgentResponse(ReadOnlyMemory<char> jsonPayload)
+    {
+        try
+        {
+            return JsonSerializer.Deserialize(jsonPayload.Span, AgentJsonContext.Default.AgentResponse);
+        }
+        catch (JsonException ex)
+        {
+            _logger.LogWarning(ex, "Strict JSON parse of agent response failed; retrying with lenient options.");
+            return JsonSerializer.Deserialize(jsonPayload.Span, LenientAgentJsonContext.Default.AgentResponse);
+        }
+    }
 
-        return options;
+    internal AgentResponse[]? DeserializeAgentResponses(ReadOnlyMemory<char> jsonPayload)
+    {
+        try
+        {
+            return JsonSerializer.Deserialize(jsonPayload.Span, AgentJsonContext.Default.AgentResponseArray);
+        }
+        catch (JsonException ex)
+        {
+            _logger.LogWarning(ex, "Strict JSON parse of batched agent response failed; retrying with lenient options.");
+            return JsonSerializer.Deserialize(jsonPayload.Span, LenientAgentJsonContext.Default.AgentResponseArray);
+        }
     }
 
-    private ChatCompletionsOptions BuildFallbackChatOptions(string resumeContent)
+    /// <summary>
+    /// Extracts the JSON payload (object or array) from a text response in a single
+    /// scan, tolerating Markdown code fences (with or without a json tag) plus leading
+    /// prose and trailing commentary around the fence. Unfenced responses pass through
+    /// trimmed. The result is a slice over the original response — no intermediate
+    /// string is allocated before the payload reaches the deserializer.
+    /// </summary>
+    internal static ReadOnlyMemory<char> ExtractJsonPayload(string responseText)
+    {
+        var match = CodeFenceRegex().Match(responseText);
+        if (match.Success)
+        {
+            var payload = match.Groups[1];
+            return responseText.AsMemory(payload.Index, payload.Length);
+        }
+
+        return responseText.AsMemory().Trim();
+    }
+
+    [GeneratedRegex(@"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", RegexOptions.Singleline)]
+    private static partial Regex CodeFenceRegex();
+
+    /// <summary>
+    /// Maps a model-produced category onto the fixed set the frontend understands,
+    /// fixing casing drift and replacing unrecognized values with "Content". The set
+    /// is frozen at startup so validation is a single read-optimized lookup. Keep this
+    /// list in sync with the enum in the function schema.
+    /// </summary>
+    internal static string NormalizeCategory(string category) =>
+        AllowedCategories.TryGetValue(category, out var canonical) ? canonical : DefaultCategory;
+
+    private const string DefaultCategory = "Content";
+
+    private static readonly FrozenDictionary<string, string> AllowedCategories =
+        new[] { "Skills", "Experience", "Format", "Content", "Impact", "System" }
+            .ToFrozenDictionary(category => category, category => category, StringComparer.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Builds the user prompt with all static framing first and the variable resume
+    /// content strictly last, so provider-side prompt caching can match the longest
+    /// possible prefix across requests. Keep any new scaffolding ahead of the content.
+    /// The prompt is a single concat of the precomputed prefix constant and the
+    /// content — one allocation per request, no template parsing or interpolation.
+    /// </summary>
+    internal static string BuildAnalysisPrompt(string resumeContent) =>
+        string.Concat(AnalysisPromptPrefix, resumeContent);
+
+    internal const string AnalysisPromptPrefix =
+        "Analyze this resume and provide a comprehensive evaluation in the requested JSON format.\n\nRESUME CONTENT:\n---\n";
+
+    internal static string BuildBatchPrompt(IReadOnlyList<ResumeAnalysisRequest> requests)
+    {
+        var builder = new StringBuilder(BatchPromptPrefix.Length + requests.Sum(r => r.Content.Length + 32));
+        builder.Append(BatchPromptPrefix);
+
+        for (var i = 0; i < requests.Count; i++)
+        {
+            builder.Append("RESUME ").Append(i + 1).Append(":\n---\n").Append(requests[i].Content).Append("\n---\n\n");
+        }
+
+        return builder.ToString();
+    }
+
+    /// <summary>
+    /// Truncates content to the configured token budget using a conservative
+    /// four-characters-per-token estimate, cutting at a word boundary so the model
+    /// never sees a split word. Returns the original string when it fits, so callers
+    /// can detect truncation by reference. Exact tokenization would add a tokenizer
+    /// dependency for a bound that only matters near the limit; the estimate errs on
+    /// the generous side for prose.
+    /// </summary>
+    internal static string TruncateToTokenBudget(string content, int maxTokens)
+    {
+        if (maxTokens <= 0)
+        {
+            return content;
+        }
+
+        var maxChars = maxTokens * CharsPerTokenEstimate;
+        if (content.Length <= maxChars)
+        {
+            return content;
+        }
+
+        var lastWordBoundary = content.LastIndexOf(' ', maxChars - 1);
+        return content[..(lastWordBoundary > 0 ? lastWordBoundary : maxChars)];
+    }
+
+    private const int CharsPerTokenEstimate = 4;
+
+    internal const string BatchPromptPrefix =
+        "Analyze each of the following resumes independently. Respond with a JSON array containing one analysis object per resume, in the same order, each using the schema of the resume_analysis function (score, optimizedContent, candidateInfo, suggestions).\n\n";
+
+    private ChatCompletionsOptions CreateChatOptions(string systemPrompt, string resumeContent)
     {
-        _logger.LogWarning("Using fallback prompt. This should only happen during initial setup or database issues.");
-        
         var options = new ChatCompletionsOptions
         {
             DeploymentName = _options.Deployment,
-            Temperature = (float)_options.Temperature,
-            NucleusSamplingFactor = (float)_options.TopP,
+            Temperature = _temperature,
+            NucleusSamplingFactor = _topP,
             MaxTokens = 1200,
-            Functions = { new FunctionDefinition 
-            { 
-                Name = "resume_analysis",
-                Description = "Analyze a resume and provide structured feedback",
-                Parameters = BinaryData.FromString(JsonSchema)
-            }}
+            Functions = { ResumeAnalysisFunction }
         };
 
-        options.Messages.Add(new ChatRequestSystemMessage(FallbackSystemPrompt));
-        options.Messages.Add(new ChatRequestUserMessage(resumeContent));
+        options.Messages.Add(new ChatRequestSystemMessage(systemPrompt));
+        options.Messages.Add(new ChatRequestUserMessage(BuildAnalysisPrompt(resumeContent)));
 
         return options;
     }
 
+    // Built once: the function definition and its schema are identical on every call,
+    // which also keeps the provider-visible prompt scaffolding byte-stable for caching.
+    private static readonly FunctionDefinition ResumeAnalysisFunction = new()
+    {
+        Name = "resume_analysis",
+        Description = "Analyze a resume and provide structured feedback",
+        Parameters = BinaryData.FromString(JsonSchema)
+    };
+
     private const string FallbackSystemPrompt = """
 You are an expert resume analyst. Evaluate the candidate's resume and respond with JSON that includes:
 1. A score from 0-100 based on ATS compatibility, clarity, and achievement quantification
@@ -213,6 +581,7 @@ You are an expert resume analyst. Evaluate the candidate's resume and respond wi
 3. Extracted candidate information (name, contact, skills, experience)
 4. Actionable suggestions focusing on ATS optimization, quantifying achievements, and aligning skills to target roles
 
+Each suggestion's category must be exactly one of: Skills, Experience, Format, Content, Impact, System.
 Keep responses concise and professional. Extract all available candidate information from the resume.
 """;
 
@@ -250,7 +619,7 @@ Keep responses concise and professional. Extract all available candidate informa
         "type": "object",
         "required": ["category", "description", "priority"],
         "properties": {
-          "category": { "type": "string" },
+          "category": { "type": "string", "enum": ["Skills", "Experience", "Format", "Content", "Impact", "System"] },
           "description": { "type": "string" },
           "priority": { "type": "integer", "minimum": 1, "maximum": 5 }
         }
@@ -264,60 +633,4 @@ Keep responses concise and professional. Extract all available candidate informa
 }
 """;
 
-    private sealed class AgentResponse
-    {
-        [JsonPropertyName("score")]
-        public double Score { get; init; }
-
-        [JsonPropertyName("optimizedContent")]
-        public string OptimizedContent { get; init; } = string.Empty;
-
-        [JsonPropertyName("candidateInfo")]
-        public AgentCandidateInfo? CandidateInfo { get; init; }
-
-        [JsonPropertyName("suggestions")]
-        public IReadOnlyList<AgentSuggestion>? Suggestions { get; init; }
-
-        [JsonPropertyName("metadata")]
-        public Dictionary<string, JsonElement>? Metadata { get; init; }
-    }
-
-    private sealed class AgentCandidateInfo
-    {
-        [JsonPropertyName("fullName")]
-        public string FullName { get; init; } = string.Empty;
-
-        [JsonPropertyName("email")]
-        public string Email { get; init; } = string.Empty;
-
-        [JsonPropertyName("phone")]
-        public string? Phone { get; init; }
-
-        [JsonPropertyName("location")]
-        public string? Location { get; init; }
-
-        [JsonPropertyName("skills")]
-        public string Skills { get; init; } = string.Empty;
-
-        [JsonPropertyName("yearsOfExperience")]
-        public int? YearsOfExperience { get; init; }
-
-        [JsonPropertyName("currentJobTitle")]
-        public string? CurrentJobTitle { get; init; }
-
-        [JsonPropertyName("education")]
-        public string? Education { get; init; }
-    }
-
-    private sealed class AgentSuggestion
-    {
-        [JsonPropertyName("category")]
-        public string Category { get; init; } = string.Empty;
-
-        [JsonPropertyName("description")]
-        public string Description { get; init; } = string.Empty;
-
-        [JsonPropertyName("priority")]
-    public int Priority { get; init; }
-    }
 }
@@ -1,5 +1,6 @@
 using Azure;
 using Azure.AI.FormRecognizer.DocumentAnalysis;
+using Azure.Core.Pipeline;
 using Azure.Identity;
 using Azure.Security.KeyVault.Secrets;
 using Azure.Storage.Blobs;
@@ -22,6 +23,19 @@ namespace CVAnalyzer.Infrastructure;
 
 public static class DependencyInjection
 {
+    // One credential for every Azure client so token acquisition goes through a single
+    // in-memory token cache instead of each client re-authenticating independently.
+    private static readonly Lazy<DefaultAzureCredential> SharedCredential = new(() => new DefaultAzureCredential());
+
+    // One connection pool for all outbound model traffic (completions, embeddings,
+    // warmup). The pooled-connection lifetime keeps long-lived connections honoring
+    // DNS changes on the endpoint.
+    private static readonly Lazy<HttpClient> SharedHttpClient = new(() => new HttpClient(new SocketsHttpHandler
+    {
+        PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+        MaxConnectionsPerServer = 100
+    }));
+
     public static IServiceCollection AddInfrastructure(this IServiceCollection services, IConfiguration configuration)
     {
         services.Configure<AzureStorageOptions>(options => configuration.GetSection(AzureStorageOptions.SectionName).Bind(options));
@@ -77,20 +91,31 @@ public static class DependencyInjection
                 throw new InvalidOperationException("Agent:Endpoint configuration value is required.");
             }
 
+            var clientOptions = new OpenAIClientOptions
+            {
+                Transport = new HttpClientTransport(SharedHttpClient.Value)
+            };
+
             // Use API key if provided (local development), otherwise use DefaultAzureCredential (production)
             if (!string.IsNullOrWhiteSpace(options.ApiKey))
             {
-                return new OpenAIClient(new Uri(options.Endpoint), new AzureKeyCredential(options.ApiKey));
+                return new OpenAIClient(new Uri(options.Endpoint), new AzureKeyCredential(options.ApiKey), clientOptions);
             }
             else
             {
-                var credential = new DefaultAzureCredential();
-                return new OpenAIClient(new Uri(options.Endpoint), credential);
+                return new OpenAIClient(new Uri(options.Endpoint), SharedCredential.Value, clientOptions);
             }
         });
 
+        // Caches are singletons so cached analyses survive across request scopes
+        services.AddSingleton<AgentService.Caching.ExactMatchResponseCache>();
+        services.AddSingleton<AgentService.Caching.SemanticResponseCache>();
+
         // Register ResumeAnalysisAgent as scoped to access scoped IPromptTemplateRepository
         services.AddScoped<AgentService.ResumeAnalysisAgent>();
+
+        // Primes the connection pool and token cache so the first analysis is not cold
+        services.AddHostedService<AgentService.AgentWarmupService>();
     }
 
     private static void ConfigureDatabase(IServiceCollection services, IConfiguration configuration)
@@ -104,7 +129,7 @@ public static class DependencyInjection
             {
                 try
                 {
-                    var secretClient = new SecretClient(new Uri(keyVaultUri), new DefaultAzureCredential());
+                    var secretClient = new SecretClient(new Uri(keyVaultUri), SharedCredential.Value);
                     var secretResponse = secretClient.GetSecret("DatabaseConnectionString");
                     connectionString = secretResponse.Value.Value;
                 }
@@ -145,9 +170,8 @@ public static class DependencyInjection
         }
         else if (!string.IsNullOrEmpty(storageOptions.AccountName))
         {
-            var credential = new DefaultAzureCredential();
-            services.AddSingleton(new BlobServiceClient(new Uri($"https://{storageOptions.AccountName}.blob.core.windows.net"), credential));
-            services.AddSingleton(new QueueServiceClient(new Uri($"https://{storageOptions.AccountName}.queue.core.windows.net"), credential));
+            services.AddSingleton(new BlobServiceClient(new Uri($"https://{storageOptions.AccountName}.blob.core.windows.net"), SharedCredential.Value));
+            services.AddSingleton(new QueueServiceClient(new Uri($"https://{storageOptions.AccountName}.queue.core.windows.net"), SharedCredential.Value));
         }
     }
 
@@ -174,7 +198,7 @@ public static class DependencyInjection
         }
         else if (docIntelOptions.UseManagedIdentity)
         {
-            services.AddSingleton(new DocumentAnalysisClient(new Uri(docIntelOptions.Endpoint), new DefaultAzureCredential()));
+            services.AddSingleton(new DocumentAnalysisClient(new Uri(docIntelOptions.Endpoint), SharedCredential.Value));
         }
         else
         {
@@ -103,16 +103,30 @@ public class ResumeAnalysisOrchestrator
 
             _logger.LogInformation("Resume {ResumeId} analysis completed with score {Score}", resume.Id, resume.Score);
         }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Shutdown or caller cancellation, not a failure: reset for retry without
+            // the error log. The token is already cancelled, so cleanup must run on
+            // CancellationToken.None or the rollback itself would throw.
+            _logger.LogInformation("Analysis of resume {ResumeId} was cancelled. Rolling back transaction.", resume.Id);
+
+            await transaction.RollbackAsync(CancellationToken.None);
+
+            resume.Status = ResumeStatus.Pending;
+            await context.SaveChangesAsync(CancellationToken.None);
+
+            throw;
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Failed to analyze resume {ResumeId}. Rolling back transaction.", resume.Id);
-            
+
             await transaction.RollbackAsync(cancellationToken);
-            
+
             // Update status to pending for retry
             resume.Status = ResumeStatus.Pending;
             await context.SaveChangesAsync(cancellationToken);
-            
+
             throw;
         }
     }
@@ -0,0 +1,98 @@
+using Azure.AI.OpenAI;
+using CVAnalyzer.AgentService;
+using CVAnalyzer.AgentService.Caching;
+using CVAnalyzer.Domain.Repositories;
+using FluentAssertions;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using NSubstitute;
+using Xunit;
+
+namespace CVAnalyzer.UnitTests.AgentService;
+
+public class AgentResponseParsingTests
+{
+    private static ResumeAnalysisAgent CreateAgent()
+    {
+        var options = Options.Create(new AgentServiceOptions());
+        var client = Substitute.For<OpenAIClient>();
+        var environment = Substitute.For<IHostEnvironment>();
+        environment.EnvironmentName.Returns("Development");
+
+        return new ResumeAnalysisAgent(
+            client,
+            options,
+            Substitute.For<IPromptTemplateRepository>(),
+            new ExactMatchResponseCache(options),
+            new SemanticResponseCache(client, options, NullLogger<SemanticResponseCache>.Instance),
+            environment,
+            NullLogger<ResumeAnalysisAgent>.Instance);
+    }
+
+    [Fact]
+    public void DeserializeAgentResponse_Should_Parse_Well_Formed_Payload()
+    {
+        var response = CreateAgent().DeserializeAgentResponse(
+            "{\"score\": 85, \"optimizedContent\": \"Improved summary\", \"suggestions\": []}");
+
+        response.Should().NotBeNull();
+        response!.Score.Should().Be(85);
+        response.OptimizedContent.Should().Be("Improved summary");
+    }
+
+    [Fact]
+    public void DeserializeAgentResponse_Should_Recover_From_Trailing_Commas()
+    {
+        var response = CreateAgent().DeserializeAgentResponse(
+            "{\"score\": 72, \"optimizedContent\": \"Improved summary\", \"suggestions\": [],}");
+
+        response.Should().NotBeNull();
+        response!.Score.Should().Be(72);
+    }
+
+    [Fact]
+    public void ExtractJsonPayload_Should_Unwrap_Json_Tagged_Code_Fence()
+    {
+        var payload = ResumeAnalysisAgent.ExtractJsonPayload("```json\n{\"score\": 80}\n```");
+
+        payload.ToString().Should().Be("{\"score\": 80}");
+    }
+
+    [Fact]
+    public void ExtractJsonPayload_Should_Unwrap_Untagged_Code_Fence()
+    {
+        var payload = ResumeAnalysisAgent.ExtractJsonPayload("```\n{\"score\": 80}\n```");
+
+        payload.ToString().Should().Be("{\"score\": 80}");
+    }
+
+    [Fact]
+    public void ExtractJsonPayload_Should_Ignore_Prose_Around_The_Fence()
+    {
+        var response = "Here is the analysis:\n```json\n{\"score\": 80}\n```\nLet me know if you need more.";
+
+        var payload = ResumeAnalysisAgent.ExtractJsonPayload(response);
+
+        payload.ToString().Should().Be("{\"score\": 80}");
+    }
+
+    [Fact]
+    public void ExtractJsonPayload_Should_Pass_Through_Unfenced_Json_Trimmed()
+    {
+        var payload = ResumeAnalysisAgent.ExtractJsonPayload("  {\"score\": 80}\n");
+
+        payload.ToString().Should().Be("{\"score\": 80}");
+    }
+
+    [Theory]
+    [InlineData("Skills", "Skills")]
+    [InlineData("experience", "Experience")]
+    [InlineData("FORMAT", "Format")]
+    [InlineData("Layout", "Content")]
+    [InlineData("", "Content")]
+    public void NormalizeCategory_Should_Canonicalize_Or_Fall_Back(string category, string expected)
+    {
+        ResumeAnalysisAgent.NormalizeCategory(category).Should().Be(expected);
+    }
+}
@@ -0,0 +1,76 @@
+using CVAnalyzer.AgentService;
+using CVAnalyzer.AgentService.Models;
+using FluentAssertions;
+using Xunit;
+
+namespace CVAnalyzer.UnitTests.AgentService;
+
+public class AnalysisPromptTests
+{
+    [Fact]
+    public void BuildAnalysisPrompt_Should_Share_Identical_Prefix_Across_Different_Resumes()
+    {
+        var first = ResumeAnalysisAgent.BuildAnalysisPrompt("Jane Doe, software engineer with 5 years of experience.");
+        var second = ResumeAnalysisAgent.BuildAnalysisPrompt("John Smith, data analyst focused on BI dashboards.");
+
+        var prefixLength = ResumeAnalysisAgent.AnalysisPromptPrefix.Length;
+        first[..prefixLength].Should().Be(second[..prefixLength],
+            "provider-side prompt caching matches on the longest common prefix");
+    }
+
+    [Fact]
+    public void BuildAnalysisPrompt_Should_End_With_The_Resume_Content()
+    {
+        const string content = "Jane Doe, software engineer.";
+
+        var prompt = ResumeAnalysisAgent.BuildAnalysisPrompt(content);
+
+        prompt.Should().EndWith(content, "no static text may follow the variable segment");
+    }
+
+    [Fact]
+    public void BuildBatchPrompt_Should_Number_Resumes_In_Submission_Order()
+    {
+        var requests = new[]
+        {
+            new ResumeAnalysisRequest { Content = "First resume content", UserId = "user-1" },
+            new ResumeAnalysisRequest { Content = "Second resume content", UserId = "user-2" }
+        };
+
+        var prompt = ResumeAnalysisAgent.BuildBatchPrompt(requests);
+
+        prompt.Should().StartWith(ResumeAnalysisAgent.BatchPromptPrefix);
+        prompt.IndexOf("RESUME 1:", StringComparison.Ordinal)
+            .Should().BeLessThan(prompt.IndexOf("RESUME 2:", StringComparison.Ordinal));
+        prompt.Should().Contain("First resume content");
+        prompt.Should().Contain("Second resume content");
+    }
+
+    [Fact]
+    public void TruncateToTokenBudget_Should_Return_Same_Instance_When_Within_Budget()
+    {
+        const string content = "Short resume.";
+
+        ResumeAnalysisAgent.TruncateToTokenBudget(content, 3000).Should().BeSameAs(content);
+    }
+
+    [Fact]
+    public void TruncateToTokenBudget_Should_Cut_Long_Content_At_A_Word_Boundary()
+    {
+        var content = string.Join(' ', Enumerable.Repeat("word", 200));
+
+        var truncated = ResumeAnalysisAgent.TruncateToTokenBudget(content, maxTokens: 10);
+
+        truncated.Length.Should().BeLessThanOrEqualTo(40, "10 tokens x 4 chars per token");
+        truncated.Should().NotEndWith(" ");
+        truncated.Split(' ').Should().OnlyContain(w => w == "word", "no word may be split");
+    }
+
+    [Fact]
+    public void TruncateToTokenBudget_Should_Not_Truncate_When_Budget_Is_Disabled()
+    {
+        var content = new string('x', 100_000);
+
+        ResumeAnalysisAgent.TruncateToTokenBudget(content, 0).Should().BeSameAs(content);
+    }
+}
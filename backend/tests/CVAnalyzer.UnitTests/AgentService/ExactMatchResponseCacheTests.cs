@@ -0,0 +1,67 @@
+using CVAnalyzer.AgentService;
+using CVAnalyzer.AgentService.Caching;
+using CVAnalyzer.AgentService.Models;
+using FluentAssertions;
+using Microsoft.Extensions.Options;
+using Xunit;
+
+namespace CVAnalyzer.UnitTests.AgentService;
+
+public class ExactMatchResponseCacheTests
+{
+    private static ExactMatchResponseCache CreateCache(int capacity = 1024) =>
+        new(Options.Create(new AgentServiceOptions { ExactCacheCapacity = capacity }));
+
+    private static ResumeAnalysisResponse CreateResponse(double score) =>
+        new() { Score = score, OptimizedContent = $"optimized-{score}" };
+
+    [Fact]
+    public void TryGet_Should_Return_False_For_Unknown_Content()
+    {
+        var cache = CreateCache();
+
+        cache.TryGet("never seen", out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void Set_Then_TryGet_Should_Return_Cached_Response()
+    {
+        var cache = CreateCache();
+        var response = CreateResponse(88);
+
+        cache.Set("resume content", response);
+
+        cache.TryGet("resume content", out var cached).Should().BeTrue();
+        cached.Should().BeSameAs(response);
+    }
+
+    [Fact]
+    public void Set_Should_Evict_Least_Recently_Used_Entry_When_Over_Capacity()
+    {
+        var cache = CreateCache(capacity: 2);
+
+        cache.Set("first", CreateResponse(1));
+        cache.Set("second", CreateResponse(2));
+
+        // Touch "first" so "second" becomes the eviction candidate
+        cache.TryGet("first", out _).Should().BeTrue();
+
+        cache.Set("third", CreateResponse(3));
+
+        cache.TryGet("first", out _).Should().BeTrue();
+        cache.TryGet("second", out _).Should().BeFalse();
+        cache.TryGet("third", out _).Should().BeTrue();
+    }
+
+    [Fact]
+    public void Set_Should_Replace_Existing_Entry_For_Same_Content()
+    {
+        var cache = CreateCache();
+
+        cache.Set("resume content", CreateResponse(50));
+        cache.Set("resume content", CreateResponse(90));
+
+        cache.TryGet("resume content", out var cached).Should().BeTrue();
+        cached.Score.Should().Be(90);
+    }
+}